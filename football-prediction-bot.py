@@ -1,14 +1,27 @@
-import http.client
+import html
 import json
 import random
+import re
 import os
+import tempfile
 import time
 import logging
-import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-import pytz
-import schedule
+from functools import lru_cache
+from itertools import repeat
+from typing import Optional
+from zoneinfo import ZoneInfo
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Parseur JSON natif, plus rapide, qui lit directement les octets de la réponse
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Configuration du logging
 logging.basicConfig(
@@ -18,6 +31,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger('prediction_bot')
 
+# Extrait la ligne de buts d'une issue "over" (ex: "Over 2.5", "Total Over (3.5)")
+OVER_LINE_RE = re.compile(r'over\D*?(\d+\.\d+)', re.IGNORECASE)
+
+@lru_cache(maxsize=512)
+def format_kickoff(timestamp, tz):
+    """Heure locale HH:MM d'un coup d'envoi (cache borné : les matchs d'un coupon partagent souvent un horaire)"""
+    return datetime.fromtimestamp(timestamp, tz).strftime('%H:%M')
+
+@dataclass(slots=True)
+class Prediction:
+    """Pari retenu pour un match du coupon"""
+    home_team: str
+    away_team: str
+    league: str
+    time: str
+    type: str
+    odds: float
+
 class FootballPredictionBot:
     def __init__(self):
         """Initialisation avec les variables d'environnement"""
@@ -32,10 +63,31 @@ class FootballPredictionBot:
             'x-rapidapi-host': self.rapidapi_host
         }
         
-        self.timezone = pytz.timezone('Africa/Brazzaville')
+        # Session HTTP persistante (keep-alive) partagée par RapidAPI et Telegram
+        self.session = requests.Session()
+        # Nouvelles tentatives uniquement sur les statuts transitoires, en respectant Retry-After
+        retries = Retry(
+            total=3,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=retries))
+        # Accept est envoyé à RapidAPI comme à Telegram ; les clés RapidAPI restent
+        # par requête pour ne jamais être transmises à api.telegram.org
+        self.session.headers.update({'Accept': 'application/json'})
+        
+        self.timezone = ZoneInfo('Africa/Brazzaville')
+        self.run_hour = 7
+        self.max_sleep = 3600
         self.predictions = {}
         self.coupon_total_odds = 1.0
         
+        # Générateur aléatoire dédié ; RANDOM_SEED permet de rejouer un tirage pour le débogage
+        self.rng = random.Random(os.environ.get('RANDOM_SEED'))
+        
         # Barème des cotes maximales
         self.max_odds = {
             1.5: 1.85,
@@ -44,12 +96,56 @@ class FootballPredictionBot:
             4.5: 1.85
         }
         
+        # Marchés "over" analysés : total du match, total domicile, total extérieur
+        self.total_market_id = '17'
+        self.home_total_market_id = '15'
+        self.away_total_market_id = '62'
+        self.over_market_ids = (self.total_market_id, self.home_total_market_id, self.away_total_market_id)
+        
+        # Paliers de prédiction par ordre de priorité :
+        # (type, ligne retenue sur le marché total, conditions (marché, ligne) à respecter)
+        total, home, away = self.over_market_ids
+        self.prediction_tiers = (
+            ('+3,5 buts', 3.5, ((total, 3.5), (total, 4.5))),
+            ('+2,5 buts', 2.5, ((total, 2.5), (home, 1.5), (away, 1.5))),
+            ('+1,5 buts', 1.5, ((total, 1.5),)),
+        )
+        # La cote retenue doit figurer parmi les conditions validées de son palier
+        for pred_type, line, conditions in self.prediction_tiers:
+            if (total, line) not in conditions:
+                raise ValueError(f"Palier {pred_type}: ligne {line} du marché total non vérifiée")
+        
         self.min_odds = 1.10
         self.min_matches = 2
         self.max_matches = 5
 
+        # Nombre maximal de requêtes RapidAPI simultanées
+        self.max_workers = 6
+
+        # Matchs du jour déjà filtrés : (date, instant monotonic du chargement, matchs)
+        self._fixtures_cache = None
+        self.fixtures_cache_ttl = 1800
+
+        # Cache disque conservé entre deux lancements (relance après échec)
+        self.cache_dir = os.environ.get(
+            'CACHE_DIR', os.path.join(tempfile.gettempdir(), 'football_bot_cache')
+        )
+        self.odds_disk_ttl = 600
+        self.league_disk_ttl = 300
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            # Répertoire inutilisable : le bot tourne sans cache disque
+            logger.warning("Cache disque désactivé (%s): %s", self.cache_dir, e)
+            self.cache_dir = None
+
         # Liste des IDs de ligue
-        self.league_ids = [1, 118, 148, 127, 110, 136, 251, 252, 253, 301, 302, 303, 304]
+        self.league_ids = (1, 118, 148, 127, 110, 136, 251, 252, 253, 301, 302, 303, 304)
+        # Endpoints des matchs par ligue, construits une seule fois
+        self.league_endpoints = tuple(
+            (league_id, f"/matches?sport_id=1&league_id={league_id}&mode=line&lng=en")
+            for league_id in self.league_ids
+        )
 
     def _check_env_variables(self):
         """Vérification des variables obligatoires"""
@@ -68,18 +164,32 @@ class FootballPredictionBot:
             # Génération immédiate du premier coupon
             self.generate_coupon()
             
-            # Planification quotidienne à 07h00
-            schedule.every().day.at("07:00").do(self.generate_coupon)
-            
             logger.info("Bot démarré - Premier coupon généré immédiatement")
             logger.info("Prochaine exécution programmée à 07h00 chaque jour")
             
             while True:
-                schedule.run_pending()
-                time.sleep(60)
+                self.sleep_until_next_run()
+                self.generate_coupon()
                 
         except Exception as e:
-            logger.error(f"Erreur critique: {str(e)}", exc_info=True)
+            logger.error("Erreur critique: %s", e, exc_info=True)
+
+    def next_run_time(self):
+        """Calcule la prochaine échéance quotidienne d'exécution"""
+        now = datetime.now(self.timezone)
+        next_run = now.replace(hour=self.run_hour, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return next_run
+
+    def sleep_until_next_run(self):
+        """Dort jusqu'à la prochaine échéance par tranches bornées (veille, dérive d'horloge)"""
+        next_run = self.next_run_time()
+        while True:
+            remaining = (next_run - datetime.now(self.timezone)).total_seconds()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.max_sleep))
 
     def generate_coupon(self):
         """Génère un nouveau coupon de paris"""
@@ -89,219 +199,295 @@ class FootballPredictionBot:
         
         self.predictions = {}
         self.coupon_total_odds = 1.0
+        self.prune_disk_cache()
         
         matches = self.get_todays_matches()
         if not matches:
             logger.error("Aucun match disponible aujourd'hui")
             return
             
-        selected_matches = random.sample(matches, min(self.max_matches * 3, len(matches)))
-        valid_matches = 0
+        # Copie : la liste du jour est partagée avec le cache et mélangée sur place
+        candidates = list(matches)
+        batch = self.draw_candidates(candidates, 0, self.max_matches * 3)
+        cursor = len(batch)
         replacement_attempts = 0
-        max_replacements = len(matches)
         
-        while valid_matches < self.min_matches and replacement_attempts < max_replacements:
-            for match in selected_matches[:]:
-                if valid_matches >= self.max_matches:
+        # Les analyses d'un même lot sont indépendantes : elles partent en parallèle
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while batch:
+                for match, prediction in zip(batch, executor.map(self.analyze_match, batch)):
+                    if len(self.predictions) >= self.max_matches:
+                        break
+                        
+                    if prediction and match['id'] not in self.predictions:
+                        self.predictions[match['id']] = prediction
+                        self.coupon_total_odds *= prediction.odds
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Match sélectionné: %s", self.format_match_log(prediction))
+                
+                if len(self.predictions) >= self.min_matches or cursor >= len(candidates):
                     break
-                    
-                prediction = self.analyze_match(match)
-                if prediction:
-                    self.predictions[match['id']] = prediction
-                    valid_matches += 1
-                    selected_matches.remove(match)
-                    logger.info(f"Match sélectionné: {self.format_match_log(prediction)}")
-            
-            if valid_matches < self.min_matches and len(matches) > len(selected_matches):
-                new_candidates = [m for m in matches if m not in selected_matches]
-                if new_candidates:
-                    selected_matches.extend(random.sample(new_candidates, 1))
-                    replacement_attempts += 1
-                    logger.info(f"Tentative de remplacement #{replacement_attempts}")
+                
+                # Remplacement par les prochains matchs du tirage, une vague complète
+                # de workers à la fois plutôt qu'un aller-retour réseau par match
+                batch = self.draw_candidates(candidates, cursor, self.max_workers)
+                cursor += len(batch)
+                replacement_attempts += 1
+                logger.info("Tentative de remplacement #%d", replacement_attempts)
         
         if self.predictions:
-            self.coupon_total_odds = round(math.prod(
-                pred['odds'] for pred in self.predictions.values()
-            ), 2)
+            self.coupon_total_odds = round(self.coupon_total_odds, 2)
             
             logger.info("\n" + "="*50)
             logger.info("RÉCAPITULATIF DU COUPON FINAL")
-            for pred in self.predictions.values():
-                logger.info(self.format_match_log(pred))
-            logger.info(f"COTE TOTALE: {self.coupon_total_odds}")
+            if logger.isEnabledFor(logging.INFO):
+                for pred in self.predictions.values():
+                    logger.info(self.format_match_log(pred))
+            logger.info("COTE TOTALE: %s", self.coupon_total_odds)
             logger.info("="*50 + "\n")
             
             self.send_coupon()
         else:
             logger.error("Impossible de générer un coupon valide")
 
+    def draw_candidates(self, candidates, start, count):
+        """Tire au hasard les count prochains candidats (Fisher-Yates partiel, sur place)"""
+        n = len(candidates)
+        stop = min(start + count, n)
+        for i in range(start, stop):
+            j = self.rng.randrange(i, n)
+            candidates[i], candidates[j] = candidates[j], candidates[i]
+        return candidates[start:stop]
+
     def format_match_log(self, prediction):
         """Formatage pour les logs Render"""
         return (
-            f"{prediction['league'].upper()}\n"
-            f"{prediction['home_team']} vs {prediction['away_team']}\n"
-            f"HEURE : {prediction['time']}\n"
-            f"PRÉDICTION: {prediction['type']}\n"
-            f"Cote: {prediction['odds']}\n"
+            f"{prediction.league.upper()}\n"
+            f"{prediction.home_team} vs {prediction.away_team}\n"
+            f"HEURE : {prediction.time}\n"
+            f"PRÉDICTION: {prediction.type}\n"
+            f"Cote: {prediction.odds}\n"
+        )
+
+    def make_api_request(self, endpoint):
+        """Interroge l'API RapidAPI et retourne le champ 'data' de la réponse"""
+        response = self.session.get(
+            f"https://{self.rapidapi_host}{endpoint}",
+            headers=self.headers,
+            timeout=10
         )
+        if response.status_code in (401, 403):
+            # Erreur permanente : inutile de réessayer, la clé RapidAPI est en cause
+            logger.error("Accès refusé par RapidAPI (%s), vérifier RAPIDAPI_KEY", response.status_code)
+            return None
+        if response.status_code != 200:
+            logger.warning("Réponse API %s pour %s", response.status_code, endpoint)
+            return None
+        
+        data = json_loads(response.content)
+        if data.get('status') != 'success':
+            return None
+        return data.get('data')
 
     def get_todays_matches(self):
         """Récupère tous les matchs du jour"""
         now = datetime.now(self.timezone)
-        today_start = datetime(now.year, now.month, now.day, 0, 0, 0).replace(tzinfo=self.timezone)
+        today = now.date()
+        
+        # Liste réutilisée tant que la date n'a pas changé et qu'elle a moins de 30 minutes
+        if self._fixtures_cache:
+            cached_date, fetched_at, cached_matches = self._fixtures_cache
+            if cached_date == today and time.monotonic() - fetched_at < self.fixtures_cache_ttl:
+                logger.info("Nombre de matchs trouvés (cache): %d", len(cached_matches))
+                return cached_matches
+        
+        today_start = datetime(now.year, now.month, now.day, tzinfo=self.timezone)
         today_end = today_start + timedelta(days=1)
         
         start_timestamp = int(today_start.timestamp())
         end_timestamp = int(today_end.timestamp())
         
-        all_matches = []
-        
-        for league_id in self.league_ids:
-            try:
-                endpoint = f"/matches?sport_id=1&league_id={league_id}&mode=line&lng=en"
-                conn = http.client.HTTPSConnection(self.rapidapi_host)
-                conn.request("GET", endpoint, headers=self.headers)
-                res = conn.getresponse()
-                
-                if res.status == 200:
-                    data = json.loads(res.read().decode('utf-8'))
-                    if data.get('status') == 'success':
-                        for match in data.get('data', []):
-                            if (start_timestamp <= match.get('start_timestamp', 0) <= end_timestamp
-                                and self.is_valid_match(match)):
-                                all_matches.append(match)
-            except Exception as e:
-                logger.error(f"Erreur API pour ligue {league_id}: {str(e)}")
-            finally:
-                conn.close()
-            time.sleep(0.5)
+        # Requêtes par ligue indépendantes : exécution concurrente bornée par max_workers
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            league_results = executor.map(
+                self._fetch_league, self.league_endpoints,
+                repeat(start_timestamp), repeat(end_timestamp)
+            )
+            all_matches = [match for league_matches in league_results for match in league_matches]
             
-        logger.info(f"Nombre de matchs trouvés: {len(all_matches)}")
+        if all_matches:
+            self._fixtures_cache = (today, time.monotonic(), all_matches)
+        logger.info("Nombre de matchs trouvés: %d", len(all_matches))
         return all_matches
 
-    def is_valid_match(self, match):
+    def _fetch_league(self, league_endpoint, start_timestamp, end_timestamp):
+        """Récupère les matchs valides d'une ligue sur la fenêtre donnée (liste vide en cas d'erreur)"""
+        league_id, endpoint = league_endpoint
+        try:
+            key = f"league_{league_id}"
+            league_matches = self.read_disk_cache(key, self.league_disk_ttl)
+            if league_matches is None:
+                league_matches = self.make_api_request(endpoint)
+                if league_matches is not None:
+                    self.write_disk_cache(key, league_matches)
+            if not isinstance(league_matches, list):
+                return []
+            # Filtre total : un élément mal formé n'écarte que lui-même
+            return [
+                match for match in league_matches
+                if isinstance(match, dict)
+                and isinstance(match.get('start_timestamp'), (int, float))
+                and start_timestamp <= match['start_timestamp'] < end_timestamp
+                and self.is_valid_match(match)
+            ]
+        except Exception as e:
+            logger.error("Erreur API pour ligue %s: %s", league_id, e)
+            return []
+
+    def is_valid_match(self, match: dict) -> bool:
         """Vérifie si un match est valide pour analyse"""
-        return (
-            match.get('home_team') and match.get('away_team')
-            and len(match['home_team']) >= 3 and len(match['away_team']) >= 3
-            and match.get('id') and match.get('start_timestamp')
-            and match.get('league')
-        )
+        try:
+            return bool(
+                len(match['home_team']) >= 3 and len(match['away_team']) >= 3
+                and match['id'] and match['start_timestamp'] and match['league']
+            )
+        except (KeyError, TypeError):
+            # Champ absent ou nom d'équipe nul
+            return False
 
     def analyze_match(self, match):
         """Analyse un match et retourne une prédiction valide"""
         match_id = match['id']
         
         try:
-            endpoint = f"/matches/{match_id}/markets?mode=line&lng=en"
-            conn = http.client.HTTPSConnection(self.rapidapi_host)
-            conn.request("GET", endpoint, headers=self.headers)
-            res = conn.getresponse()
-            
-            if res.status == 200:
-                data = json.loads(res.read().decode('utf-8'))
-                if data.get('status') == 'success':
-                    return self.extract_prediction(data.get('data', {}), match)
+            markets = self.get_match_markets(match_id)
+            if markets is not None:
+                return self.extract_prediction(markets, match)
         except Exception as e:
-            logger.error(f"Erreur analyse match {match_id}: {str(e)}")
-        finally:
-            conn.close()
+            logger.error("Erreur analyse match %s: %s", match_id, e)
             
         return None
 
-    def extract_prediction(self, markets, match):
+    def get_match_markets(self, match_id):
+        """Récupère les marchés d'un match, depuis le cache disque s'il est encore frais"""
+        key = f"markets_{match_id}"
+        markets = self.read_disk_cache(key, self.odds_disk_ttl)
+        if markets is None:
+            markets = self.make_api_request(f"/matches/{match_id}/markets?mode=line&lng=en")
+            if markets is not None:
+                self.write_disk_cache(key, markets)
+        return markets
+
+    def read_disk_cache(self, key, ttl):
+        """Lit une entrée du cache disque si elle a moins de ttl secondes"""
+        if self.cache_dir is None:
+            return None
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) < ttl:
+                with open(path, 'rb') as f:
+                    return json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def write_disk_cache(self, key, data):
+        """Écrit une entrée du cache disque de façon atomique"""
+        if self.cache_dir is None:
+            return
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        # Fichier temporaire unique (threads et processus) : un fichier partiel n'est jamais lu
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except OSError as e:
+            logger.warning("Cache disque indisponible (%s): %s", key, e)
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Cache disque indisponible (%s): %s", key, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def prune_disk_cache(self):
+        """Supprime les entrées du cache disque vieilles de plus d'un jour"""
+        if self.cache_dir is None:
+            return
+        limit = time.time() - 86400
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < limit:
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.warning("Nettoyage du cache disque impossible: %s", e)
+
+    def extract_prediction(self, markets: dict, match: dict) -> Optional[Prediction]:
         """Extrait la meilleure prédiction selon le barème"""
-        valid_predictions = []
-        over_goals = {}
-        home_over = {}
-        away_over = {}
-        
-        if '17' in markets:
-            for outcome in markets['17'].get('outcomes', []):
-                name = outcome.get('name', '').lower()
-                if 'over' in name:
-                    if '1.5' in name: over_goals[1.5] = outcome.get('odds')
-                    elif '2.5' in name: over_goals[2.5] = outcome.get('odds')
-                    elif '3.5' in name: over_goals[3.5] = outcome.get('odds')
-                    elif '4.5' in name: over_goals[4.5] = outcome.get('odds')
-        
-        if '15' in markets:
-            for outcome in markets['15'].get('outcomes', []):
-                name = outcome.get('name', '').lower()
-                if 'over' in name:
-                    if '1.5' in name: home_over[1.5] = outcome.get('odds')
-                    elif '2.5' in name: home_over[2.5] = outcome.get('odds')
-        
-        if '62' in markets:
-            for outcome in markets['62'].get('outcomes', []):
-                name = outcome.get('name', '').lower()
-                if 'over' in name:
-                    if '1.5' in name: away_over[1.5] = outcome.get('odds')
-                    elif '2.5' in name: away_over[2.5] = outcome.get('odds')
-        
-        if (self.is_valid_odd(over_goals.get(3.5), 3.5) 
-            and self.is_valid_odd(over_goals.get(4.5), 4.5)):
-            valid_predictions.append({
-                'type': '+3,5 buts',
-                'odds': over_goals[3.5],
-                'priority': 1
-            })
-        
-        if (self.is_valid_odd(over_goals.get(2.5), 2.5)
-              and self.is_valid_odd(home_over.get(1.5), 1.5)
-              and self.is_valid_odd(away_over.get(1.5), 1.5)):
-            valid_predictions.append({
-                'type': '+2,5 buts',
-                'odds': over_goals[2.5],
-                'priority': 2
-            })
-        
-        if self.is_valid_odd(over_goals.get(1.5), 1.5):
-            valid_predictions.append({
-                'type': '+1,5 buts',
-                'odds': over_goals[1.5],
-                'priority': 3
-            })
+        # Cotes "over" indexées par identifiant de marché puis par ligne de buts
+        overs = {
+            market_id: self.collect_overs(markets.get(market_id))
+            for market_id in self.over_market_ids
+        }
         
-        if valid_predictions:
-            random.shuffle(valid_predictions)
-            selected = min(valid_predictions, key=lambda x: x['priority'])
-            
-            return {
-                'home_team': match['home_team'],
-                'away_team': match['away_team'],
-                'league': match['league'],
-                'time': datetime.fromtimestamp(match['start_timestamp'], self.timezone).strftime('%H:%M'),
-                'type': selected['type'],
-                'odds': selected['odds']
-            }
+        # Paliers parcourus par priorité décroissante : le premier valide l'emporte
+        for pred_type, line, conditions in self.prediction_tiers:
+            if all(self.is_valid_odd(overs[market_id].get(goals), goals)
+                   for market_id, goals in conditions):
+                return Prediction(
+                    home_team=match['home_team'],
+                    away_team=match['away_team'],
+                    league=match['league'],
+                    time=format_kickoff(match['start_timestamp'], self.timezone),
+                    type=pred_type,
+                    odds=overs[self.total_market_id][line]
+                )
             
         return None
 
-    def is_valid_odd(self, odd, goal_type):
+    def collect_overs(self, market: Optional[dict]) -> dict:
+        """Indexe les cotes "over" d'un marché par ligne de buts"""
+        overs = {}
+        if market:
+            for outcome in market.get('outcomes', []):
+                found = OVER_LINE_RE.search(outcome.get('name', ''))
+                if found:
+                    overs[float(found.group(1))] = outcome.get('odds')
+        return overs
+
+    def is_valid_odd(self, odd: Optional[float], goal_type: float) -> bool:
         """Vérifie si une cote respecte le barème"""
-        return (odd and self.min_odds <= odd <= self.max_odds.get(goal_type, 1.85))
+        return bool(odd and self.min_odds <= odd <= self.max_odds.get(goal_type, 1.85))
 
     def send_coupon(self):
         """Envoie le coupon sur Telegram avec la mise en forme exacte demandée"""
-        message = "⚽️🔥 <b>COUPON DU JOUR</b> 🔥⚽️\n\n"
+        if not self.predictions:
+            logger.info("Aucun pari valide, envoi annulé")
+            return
         
-        for i, pred in enumerate(self.predictions.values(), 1):
-            message += (
-                f"<b>🏆 {pred['league']}</b>\n"
-                f"<b>⚔️ {pred['home_team']} vs {pred['away_team']}</b>\n"
-                f"🕒 HEURE: {pred['time']}\n"
-                f"<b>🎯 PRÉDICTION: {pred['type']}</b>\n"
-                f"<b>💰 Cote: {pred['odds']}</b>\n"
-            )
-            if i < len(self.predictions):
-                message += "――――――――――\n\n"
+        # Les noms viennent de l'API : échappés pour ne pas casser le parse_mode HTML
+        blocks = [
+            f"<b>🏆 {html.escape(pred.league)}</b>\n"
+            f"<b>⚔️ {html.escape(pred.home_team)} vs {html.escape(pred.away_team)}</b>\n"
+            f"🕒 HEURE: {pred.time}\n"
+            f"<b>🎯 PRÉDICTION: {pred.type}</b>\n"
+            f"<b>💰 Cote: {pred.odds}</b>\n"
+            for pred in self.predictions.values()
+        ]
         
-        message += f"\n<b>📊 COTE TOTALE: {self.coupon_total_odds}</b>\n\n"
-        message += "<i>🔞 Pariez de manière responsable</i>"
+        message = "".join((
+            "⚽️🔥 <b>COUPON DU JOUR</b> 🔥⚽️\n\n",
+            "――――――――――\n\n".join(blocks),
+            f"\n<b>📊 COTE TOTALE: {self.coupon_total_odds}</b>\n\n",
+            "<i>🔞 Pariez de manière responsable</i>"
+        ))
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage",
                 json={
                     'chat_id': self.telegram_channel_id,
@@ -312,7 +498,7 @@ class FootballPredictionBot:
             )
             logger.info("Coupon envoyé avec succès" if response.ok else "Échec envoi coupon")
         except Exception as e:
-            logger.error(f"Erreur envoi Telegram: {str(e)}")
+            logger.error("Erreur envoi Telegram: %s", e)
 
 if __name__ == "__main__":
     bot = FootballPredictionBot()